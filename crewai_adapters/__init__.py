@@ -4,12 +4,32 @@ CrewAI Adapters Library
 
 A library providing native adapter support for CrewAI using adapter patterns.
 """
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from crewai_adapters.base import BaseAdapter, AdapterRegistry
 from crewai_adapters.types import AdapterConfig, AdapterResponse
 from crewai_adapters.exceptions import AdapterError
-from crewai_adapters.tools import CrewAIToolsAdapter, CrewAITool
-from crewai_adapters.client import CrewAIAdapterClient
+
+if TYPE_CHECKING:
+    from crewai_adapters.tools import CrewAIToolsAdapter, CrewAITool
+    from crewai_adapters.client import CrewAIAdapterClient
+
+#: Exports resolved on first attribute access; importing the package
+#: stays cheap because crewai and mcp load only when these are used.
+_LAZY_EXPORTS = {
+    "CrewAIToolsAdapter": "crewai_adapters.tools",
+    "CrewAITool": "crewai_adapters.tools",
+    "CrewAIAdapterClient": "crewai_adapters.client",
+}
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 __version__ = "0.1.0"
 __all__ = [
@@ -21,4 +41,4 @@ __all__ = [
     "CrewAIToolsAdapter",
     "CrewAITool",
     "CrewAIAdapterClient"
-]
\ No newline at end of file
+]
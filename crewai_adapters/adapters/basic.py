@@ -29,7 +29,7 @@ class BasicAdapter(BaseAdapter):
         Returns:
             AdapterResponse with execution results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Example implementation
@@ -39,7 +39,7 @@ class BasicAdapter(BaseAdapter):
             result = f"{name}: {message}"
 
             metadata: AdapterMetadata = create_metadata(
-                source=self.__class__.__name__,
+                source=self._source_name,
                 start_time=start_time
             )
 
@@ -51,7 +51,7 @@ class BasicAdapter(BaseAdapter):
 
         except Exception as e:
             error_metadata: AdapterMetadata = create_metadata(
-                source=self.__class__.__name__,
+                source=self._source_name,
                 start_time=start_time
             )
             return AdapterResponse(
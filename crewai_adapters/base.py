@@ -16,6 +16,8 @@ class BaseAdapter(ABC):
             config: Configuration dictionary for the adapter
         """
         self.config = config or {}
+        # Cached for metadata source fields on the execute paths
+        self._source_name = type(self).__name__
         self._validate_config()
     
     @abstractmethod
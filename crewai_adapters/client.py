@@ -1,30 +1,61 @@
 """Client implementation for CrewAI adapters with MCP support."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import defaultdict
 from contextlib import AsyncExitStack
 from types import TracebackType
-from typing import Dict, List, Optional, Type, Any, cast
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Any
 import logging
+import time
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-from mcp.types import Tool as MCPTool, CallToolResult, TextContent
-from pydantic import BaseModel, create_model, Field
-from crewai.tools import BaseTool
+from mcp import StdioServerParameters
+from mcp.types import TextContent
 
-from crewai_adapters.tools import MCPToolsAdapter, CrewAIToolsAdapter
+from crewai_adapters import pool
+from crewai_adapters.exceptions import ExecutionError, MCPServerConnectionError
 from crewai_adapters.types import AdapterConfig
 
-class MCPServerConnectionError(Exception):
-    """Exception for MCP connection failures."""
-    pass
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from crewai.tools import BaseTool
+    from mcp import ClientSession
+    from mcp.types import Tool as MCPTool, CallToolResult
+
+#: Memoized session-independent tool configs (name, description,
+#: parameters) per server definition, as (monotonic timestamp, configs).
+#: Executors are deliberately not cached: they bind a live session and a
+#: client's semaphore, so they are rebuilt on every connect.
+_TOOL_CACHE: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+
+#: Seconds before a cache entry goes stale; ``None`` means never.
+_TOOL_CACHE_TTL: Optional[float] = None
+
+def _cache_key(
+    command: str,
+    args: List[str],
+    env: Optional[Dict[str, str]]
+) -> Tuple[Any, ...]:
+    """Build a hashable cache key for a server definition."""
+    return (command, tuple(args), frozenset((env or {}).items()))
 
 class CrewAIAdapterClient:
     """Client for managing CrewAI adapters and MCP tools."""
 
-    def __init__(self) -> None:
-        """Initialize the CrewAI adapter client."""
+    def __init__(self, max_inflight: int = 32) -> None:
+        """Initialize the CrewAI adapter client.
+
+        Args:
+            max_inflight: Cap on concurrently outstanding tool calls
+        """
         self.exit_stack = AsyncExitStack()
         self.sessions: Dict[str, ClientSession] = {}
         self.tools: Dict[str, List[BaseTool]] = {}
+        self._connect_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._server_params: Dict[str, StdioServerParameters] = {}
+        self._concurrency = asyncio.Semaphore(max_inflight)
 
     async def connect_to_mcp_server(
         self,
@@ -46,56 +77,141 @@ class CrewAIAdapterClient:
             encoding: Character encoding for communication
             encoding_error_handler: How to handle encoding errors
         """
-        try:
-            server_params = StdioServerParameters(
-                command=command,
-                args=args,
-                env=env,
-                encoding=encoding,
-                encoding_error_handler=encoding_error_handler
-            )
-
-            transport = await self.exit_stack.enter_async_context(
-                stdio_client(server_params)
-            )
-            read, write = transport
-            session = cast(
-                ClientSession,
-                await self.exit_stack.enter_async_context(ClientSession(read, write))
-            )
-
-            await session.initialize()
-            self.sessions[server_name] = session
-
-            # Create adapter and load tools
-            adapter = MCPToolsAdapter(AdapterConfig({
-                "tools": await self._get_mcp_tool_configs(session)
-            }))
-            self.tools[server_name] = adapter.get_all_tools()
-
-        except Exception as e:
-            logging.error(f"Connection failed: {str(e)}")
-            raise MCPServerConnectionError(f"Failed to connect to {server_name}") from e
+        # Serialize connects per server name; a second caller racing on the
+        # same name reuses the session the first one established.
+        async with self._connect_locks[server_name]:
+            if server_name in self.sessions:
+                return
+
+            try:
+                server_params = StdioServerParameters(
+                    command=command,
+                    args=args,
+                    env=env,
+                    encoding=encoding,
+                    encoding_error_handler=encoding_error_handler
+                )
+
+                # The pool hands back an initialized session, sharing one
+                # stdio subprocess between clients of the same server.
+                session = await pool.acquire(server_params)
+                self.sessions[server_name] = session
+                self._server_params[server_name] = server_params
+
+                # Reuse cached tool configs for known servers; a miss pays
+                # the list_tools round-trip once.
+                cache_key = _cache_key(command, args, env)
+                cached = _TOOL_CACHE.get(cache_key)
+                if cached is not None and (
+                    _TOOL_CACHE_TTL is None
+                    or time.monotonic() - cached[0] < _TOOL_CACHE_TTL
+                ):
+                    tool_configs = cached[1]
+                else:
+                    tool_configs = await self._get_mcp_tool_configs(session)
+                    _TOOL_CACHE[cache_key] = (time.monotonic(), tool_configs)
+
+                # Deferred: pulls in crewai, which callers that never
+                # connect shouldn't pay for at import time
+                from crewai_adapters.tools import MCPToolsAdapter
+
+                # Executors bind the session acquired by this connect and
+                # this client's semaphore, so they are never cached; the
+                # schema cache keeps the rebuilt conversion cheap.
+                adapter = MCPToolsAdapter(AdapterConfig({"tools": [
+                    {**config, "func": self._make_tool_executor(session, config["name"])}
+                    for config in tool_configs
+                ]}))
+                self.tools[server_name] = adapter.get_all_tools()
+
+            except Exception as e:
+                params = self._server_params.pop(server_name, None)
+                self.sessions.pop(server_name, None)
+                if params is not None:
+                    await pool.release(params)
+                logger.error("Connection failed for %s: %s", server_name, e)
+                raise MCPServerConnectionError(f"Failed to connect to {server_name}") from e
+
+    async def connect_to_servers(self, servers: Dict[str, Dict[str, Any]]) -> None:
+        """Connect to multiple MCP servers concurrently.
+
+        Startup cost becomes the slowest single handshake instead of the
+        sum of all of them.
+
+        Args:
+            servers: Mapping of server name to the keyword arguments
+                accepted by :meth:`connect_to_mcp_server`
+
+        Raises:
+            MCPServerConnectionError: If any of the connections fail
+        """
+        results = await asyncio.gather(
+            *(
+                self.connect_to_mcp_server(name, **params)
+                for name, params in servers.items()
+            ),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _get_mcp_tool_configs(self, session: ClientSession) -> List[Dict[str, Any]]:
-        """Get tool configurations from MCP server."""
-        try:
-            mcp_tools = await session.list_tools()
-            return [{
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": self._convert_tool_schema(tool)
-            } for tool in mcp_tools.tools]
-        except Exception as e:
-            logging.error(f"Failed to get tool configs: {str(e)}")
-            return []
+        """Get session-independent tool configurations from MCP server.
+
+        Raises on failure rather than returning an empty list: the result
+        is memoized, and caching a transient error would poison every
+        later connect to the same server definition.
+        """
+        mcp_tools = await session.list_tools()
+        return [{
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": self._convert_tool_schema(tool)
+        } for tool in mcp_tools.tools]
+
+    def _make_tool_executor(self, session: ClientSession, tool_name: str):
+        """Build an execution function calling the tool over the session.
+
+        The MCP session multiplexes requests by id, so concurrent
+        executors fanned out with ``asyncio.gather`` share the session
+        and overlap on the wire instead of serializing. The client-wide
+        semaphore bounds how many calls are in flight at once so a burst
+        cannot overwhelm the child process.
+        """
+        async def _call_tool(**kwargs: Any) -> str:
+            async with self._concurrency:
+                result = await session.call_tool(tool_name, kwargs)
+            return self._convert_call_result(result)
+        return _call_tool
+
+    @staticmethod
+    def _convert_call_result(result: CallToolResult) -> str:
+        """Convert a call_tool result to text, raising on tool errors."""
+        # Single pass over the content with the type bound locally; tools
+        # can stream many text chunks and this path runs per call.
+        _tc = TextContent
+        outputs = []
+        append = outputs.append
+        for content in result.content:
+            if type(content) is _tc:
+                append(content.text)
+        if result.isError:
+            raise ExecutionError("\n\n".join(outputs) or "Tool call failed")
+        # Most tools return one chunk; skip the join copy for that case
+        if len(outputs) == 1:
+            return outputs[0]
+        return "\n\n".join(outputs)
 
     def _convert_tool_schema(self, tool: MCPTool) -> Dict[str, Any]:
         """Convert MCP tool schema to CrewAI compatible format."""
-        if not tool.inputSchema:
+        schema = tool.inputSchema
+        if not schema:
             return {}
 
-        schema = tool.inputSchema.model_json_schema()
+        # mcp.types.Tool carries the input schema as a plain JSON dict
+        if not isinstance(schema, dict):
+            schema = schema.model_json_schema()
         return {
             "type": "object",
             "properties": schema.get("properties", {}),
@@ -113,6 +229,8 @@ class CrewAIAdapterClient:
             name: Unique identifier for the adapter
             config: Optional adapter configuration
         """
+        from crewai_adapters.tools import CrewAIToolsAdapter
+
         adapter = CrewAIToolsAdapter(config)
         self.tools[name] = adapter.get_all_tools()
 
@@ -127,7 +245,7 @@ class CrewAIAdapterClient:
         """
         if server_name:
             return self.tools.get(server_name, [])
-        return [tool for tools in self.tools.values() for tool in tools]
+        return list(itertools.chain.from_iterable(self.tools.values()))
 
     async def __aenter__(self) -> "CrewAIAdapterClient":
         """Async context manager entry."""
@@ -140,4 +258,8 @@ class CrewAIAdapterClient:
         exc_tb: Optional[TracebackType]
     ) -> None:
         """Async context manager exit."""
+        for params in self._server_params.values():
+            await pool.release(params)
+        self._server_params.clear()
+        self.sessions.clear()
         await self.exit_stack.aclose()
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Context protocol client implementation for CrewAI adapters."""
+import itertools
 from typing import Any, Dict, List, Optional, Sequence
 from mcp import MCPClient
 from mcp.config import Config as MCPConfig
@@ -45,8 +46,16 @@ class MCPCrewClient:
             **kwargs
         )
 
-    async def execute(self, messages: Sequence[Dict[str, Any]], start_time: Optional[Any] = None, **kwargs) -> AdapterResponse:
+    async def execute(
+        self,
+        messages: Sequence[Dict[str, Any]],
+        start_time: Optional[Any] = None,
+        max_messages: Optional[int] = None,
+        **kwargs
+    ) -> AdapterResponse:
         try:
+            if max_messages is not None and len(messages) > max_messages:
+                messages = list(itertools.islice(messages, max_messages))
             processed_context = await self.extract_valid_context(messages, **kwargs)
             metadata = create_metadata(
                 source=self.__class__.__name__,
@@ -15,3 +15,7 @@ class ExecutionError(AdapterError):
 class ValidationError(AdapterError):
     """Raised when adapter validation fails."""
     pass
+
+class MCPServerConnectionError(AdapterError):
+    """Raised when connecting to an MCP server fails."""
+    pass
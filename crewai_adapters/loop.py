@@ -0,0 +1,96 @@
+"""Shared event loop support for using async clients from sync code."""
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, List, Optional, TypeVar
+
+from crewai.tools import BaseTool
+
+from crewai_adapters.client import CrewAIAdapterClient
+
+T = TypeVar("T")
+
+class AsyncLoopThread(threading.Thread):
+    """Daemon thread hosting a long-lived asyncio event loop.
+
+    Sync callers submit coroutines to the loop instead of paying a fresh
+    ``asyncio.run`` (and, for MCP, a fresh subprocess) per call.
+    """
+
+    _instance: Optional["AsyncLoopThread"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initialize the thread and its event loop."""
+        super().__init__(name="crewai-adapters-loop", daemon=True)
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._start_lock = threading.Lock()
+
+    def run(self) -> None:
+        """Run the event loop until the process exits."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the loop from any thread.
+
+        Args:
+            coro: Coroutine to run on the shared loop
+
+        Returns:
+            Future resolving to the coroutine's result
+        """
+        # Serialize the lazy start: concurrent submitters could otherwise
+        # both see the thread unstarted and the loser's start() raises
+        if not self._started.is_set():
+            with self._start_lock:
+                if not self.is_alive():
+                    self.start()
+        self._started.wait()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    @classmethod
+    def get_instance(cls) -> "AsyncLoopThread":
+        """Get the process-wide shared loop thread."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+class MCPClientWrapper:
+    """Sync facade over :class:`CrewAIAdapterClient`.
+
+    All async client calls are routed through one persistent
+    :class:`AsyncLoopThread`, so sync CrewAI agents share a single set of
+    MCP sessions instead of spawning subprocesses per call.
+    """
+
+    def __init__(
+        self,
+        client: Optional[CrewAIAdapterClient] = None,
+        loop_thread: Optional[AsyncLoopThread] = None
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            client: Client to wrap, created on demand if omitted
+            loop_thread: Loop thread to submit to, shared instance by default
+        """
+        self.client = client or CrewAIAdapterClient()
+        self.loop_thread = loop_thread or AsyncLoopThread.get_instance()
+
+    def connect_to_mcp_server(self, server_name: str, **params: Any) -> None:
+        """Connect to an MCP server, blocking until the handshake completes."""
+        self.loop_thread.submit(
+            self.client.connect_to_mcp_server(server_name, **params)
+        ).result()
+
+    def get_tools(self, server_name: Optional[str] = None) -> List[BaseTool]:
+        """Get tools from the wrapped client."""
+        return self.client.get_tools(server_name)
+
+    def close(self) -> None:
+        """Close the wrapped client's sessions."""
+        self.loop_thread.submit(self.client.__aexit__(None, None, None)).result()
@@ -0,0 +1,110 @@
+"""Process-wide pool of MCP sessions shared across adapter clients."""
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+logger = logging.getLogger(__name__)
+
+_PoolKey = Tuple[Any, ...]
+
+@dataclass
+class _PoolEntry:
+    """A pooled session with its keeper task and reference count."""
+    session: ClientSession
+    refcount: int
+    keeper: "asyncio.Task[None]"
+    closed: asyncio.Event
+
+_entries: Dict[_PoolKey, _PoolEntry] = {}
+_locks: Dict[_PoolKey, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+def _key(params: StdioServerParameters) -> _PoolKey:
+    """Build a hashable pool key for a server definition."""
+    return (params.command, tuple(params.args), frozenset((params.env or {}).items()))
+
+async def _keep_session(
+    params: StdioServerParameters,
+    ready: "asyncio.Future[ClientSession]",
+    closed: asyncio.Event
+) -> None:
+    """Own a session's whole lifecycle inside one task.
+
+    anyio cancel scopes must be exited in the task that entered them, so
+    the transport and session contexts are both entered here and exited
+    here once ``closed`` is set — never in whichever tasks happened to
+    call :func:`acquire` and :func:`release`.
+    """
+    try:
+        async with stdio_client(params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                ready.set_result(session)
+                await closed.wait()
+    except BaseException as e:
+        if not ready.done():
+            ready.set_exception(e)
+            return
+        raise
+
+async def acquire(params: StdioServerParameters) -> ClientSession:
+    """Get an initialized session for the given server, spawning at most once.
+
+    Concurrent acquirers of the same server definition share one stdio
+    subprocess; each acquire must be paired with a :func:`release`.
+
+    Args:
+        params: Stdio server definition to connect to
+
+    Returns:
+        An initialized client session
+    """
+    key = _key(params)
+    async with _locks[key]:
+        entry = _entries.get(key)
+        if entry is not None:
+            entry.refcount += 1
+            return entry.session
+
+        loop = asyncio.get_running_loop()
+        ready: "asyncio.Future[ClientSession]" = loop.create_future()
+        closed = asyncio.Event()
+        keeper = loop.create_task(_keep_session(params, ready, closed))
+        try:
+            session = await ready
+        except BaseException:
+            closed.set()
+            await asyncio.gather(keeper, return_exceptions=True)
+            raise
+
+        _entries[key] = _PoolEntry(
+            session=session,
+            refcount=1,
+            keeper=keeper,
+            closed=closed
+        )
+        return session
+
+async def release(params: StdioServerParameters) -> None:
+    """Drop one reference to a pooled session, closing it on the last release.
+
+    Args:
+        params: Server definition previously passed to :func:`acquire`
+    """
+    key = _key(params)
+    async with _locks[key]:
+        entry = _entries.get(key)
+        if entry is None:
+            return
+        entry.refcount -= 1
+        if entry.refcount <= 0:
+            del _entries[key]
+            entry.closed.set()
+            try:
+                await entry.keeper
+            except Exception:
+                logger.exception("Pooled session teardown failed")
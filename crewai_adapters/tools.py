@@ -1,24 +1,28 @@
 """Tools implementation for native CrewAI adapter support."""
-from typing import Any, Dict, List, Optional, Type, Callable, Union, Awaitable
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Callable, Union, Awaitable
 from dataclasses import dataclass
+from types import MappingProxyType
 import logging
 import time
 import asyncio
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, Field, PrivateAttr, create_model
 
 from crewai_adapters.base import BaseAdapter
-from crewai_adapters.types import AdapterConfig, AdapterResponse
+from crewai_adapters.types import AdapterConfig, AdapterMetadata, AdapterResponse
 from crewai_adapters.exceptions import ConfigurationError, ExecutionError
 from crewai_adapters.utils import create_metadata
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class CrewAITool:
     """Representation of a CrewAI tool."""
     name: str
     description: str
     parameters: Union[Dict[str, Any], str]
     func: Optional[Callable[..., Union[str, Awaitable[str]]]] = None
+    args_schema: Optional[Type[BaseModel]] = None
 
 class ToolInputSchema(BaseModel):
     """Schema for tool parameters."""
@@ -29,6 +33,8 @@ class ConcreteCrewAITool(BaseTool):
     name: str = "default_tool"
     description: str = "Default tool description"
     args_schema: Type[BaseModel] = ToolInputSchema
+    _execution_func: Callable[..., Union[str, Awaitable[str]]] = PrivateAttr()
+    _is_async: bool = PrivateAttr(default=False)
 
     def __init__(
         self,
@@ -38,72 +44,164 @@ class ConcreteCrewAITool(BaseTool):
         tool_args_schema: Optional[Type[BaseModel]] = None
     ):
         """Initialize the tool."""
-        super().__init__()
-        self.name = name
-        self.description = description
-        if tool_args_schema:
-            self.args_schema = tool_args_schema
+        # One validation pass instead of validating defaults and then
+        # re-validating each field assignment
+        super().__init__(
+            name=name,
+            description=description,
+            args_schema=tool_args_schema or ToolInputSchema
+        )
         self._execution_func = execution_func
+        # Decided once here so the per-call paths skip coroutine sniffing
+        self._is_async = asyncio.iscoroutinefunction(execution_func)
 
     async def _execute_async(self, **kwargs: Any) -> str:
         """Execute async function safely."""
         try:
             result = self._execution_func(**kwargs)
-            if asyncio.iscoroutine(result):
+            if self._is_async or asyncio.iscoroutine(result):
                 result = await result
-            return str(result)
+            return result if isinstance(result, str) else str(result)
         except Exception as e:
-            logging.error(f"Tool execution failed: {str(e)}")
+            logger.error("Tool execution failed: %s", e)
             raise ExecutionError(f"Failed to execute {self.name}: {str(e)}")
 
     def _run(self, **kwargs: Any) -> str:
         """Execute the tool synchronously."""
         try:
             result = self._execution_func(**kwargs)
-            if asyncio.iscoroutine(result):
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(result)
-                finally:
-                    loop.close()
-                    asyncio.set_event_loop(None)
-            return str(result)
+            if self._is_async or asyncio.iscoroutine(result):
+                # Always drive coroutines on the shared loop thread:
+                # session-backed executors are bound to sessions living on
+                # that loop and deadlock on a private asyncio.run loop,
+                # and inside a running loop run_until_complete would raise
+                from crewai_adapters.loop import AsyncLoopThread
+                result = AsyncLoopThread.get_instance().submit(result).result()
+            return result if isinstance(result, str) else str(result)
         except Exception as e:
-            logging.error(f"Tool execution failed: {str(e)}")
+            logger.error("Tool execution failed: %s", e)
             raise ExecutionError(f"Failed to execute {self.name}: {str(e)}")
 
     async def _arun(self, **kwargs: Any) -> str:
         """Execute the tool asynchronously."""
         return await self._execute_async(**kwargs)
 
+#: JSON-Schema primitive types mapped to the Python types pydantic validates.
+_JSON_TYPE_MAP: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+def _extract_fields(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract Pydantic field definitions from a parameters dict in one pass."""
+    properties = params.get("properties")
+    if properties is not None:
+        type_map = _JSON_TYPE_MAP
+        return {
+            name: (
+                type_map.get(props.get("type", "string"), Any),
+                Field(..., description=props.get("description", ""))
+            )
+            for name, props in properties.items()
+        }
+    return {
+        name: (
+            str,
+            Field(..., description=info.get("description", "") if isinstance(info, dict) else "")
+        )
+        for name, info in params.items()
+    }
+
+#: Compiled schema models keyed by (schema name, canonical parameters).
+_SCHEMA_CACHE: Dict[Any, Type[BaseModel]] = {}
+
+def _canon(value: Any) -> Any:
+    """Reduce a parameters value to a hashable canonical form."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _canon(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canon(item) for item in value)
+    return value
+
 def _create_tool_schema(params: Dict[str, Any], schema_name: str) -> Type[BaseModel]:
-    """Create a Pydantic model for tool parameters."""
-    fields = {}
-
-    if "properties" in params:
-        properties = params["properties"]
-        for field_name, field_props in properties.items():
-            field_type = field_props.get("type", "string")
-            field_desc = field_props.get("description", "")
-            python_type = str if field_type == "string" else Any
-            fields[field_name] = (python_type, Field(..., description=field_desc))
-    else:
-        for field_name, field_info in params.items():
-            field_desc = field_info.get("description", "") if isinstance(field_info, dict) else ""
-            fields[field_name] = (str, Field(..., description=field_desc))
-
-    return create_model(schema_name, **fields)
+    """Create a Pydantic model for tool parameters.
+
+    Identical schemas recur across tools and adapter instances, so
+    compiled models are memoized by their canonical parameter form;
+    unhashable parameter values simply bypass the cache.
+    """
+    try:
+        key = (schema_name, _canon(params))
+        cached = _SCHEMA_CACHE.get(key)
+    except TypeError:
+        return create_model(schema_name, **_extract_fields(params))
+    if cached is None:
+        cached = create_model(schema_name, **_extract_fields(params))
+        _SCHEMA_CACHE[key] = cached
+    return cached
+
+#: Exact properties shape of ToolInputSchema, for the short-circuit below.
+_TOOL_INPUT_PROPERTIES = ToolInputSchema.model_json_schema()["properties"]
+
+def _schema_for_tool(name: str, parameters: Union[Dict[str, Any], str]) -> Type[BaseModel]:
+    """Resolve the args schema for a tool's declared parameters."""
+    if not isinstance(parameters, dict) or not parameters:
+        return ToolInputSchema
+    # Exact shape match only: a real tool whose schema merely resembles
+    # the test schema keeps its own descriptions and constraints
+    if parameters.get("properties") == _TOOL_INPUT_PROPERTIES:
+        return ToolInputSchema
+    return _create_tool_schema(parameters, f"{name.title()}Schema")
+
+class _DefaultToolCall:
+    """Fallback executor that echoes the call for tools without a function.
+
+    A slotted callable instead of a per-tool closure: one small object,
+    no captured cell, shared code object across all tools.
+    """
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __call__(self, **kwargs: Any) -> str:
+        formatted_params = ", ".join(f"{k}={v}" for k, v in kwargs.items())
+        return f"{self._name}({formatted_params})"
 
 class CrewAIToolsAdapter(BaseAdapter):
     """Adapter for handling native CrewAI tools."""
 
+    #: Bound format method for the miss-path error message.
+    _MISSING_FMT = "Tool {} not found".format
+
     def __init__(self, config: Optional[AdapterConfig] = None) -> None:
         """Initialize adapter with config."""
         super().__init__(config)
-        self.tools: List[CrewAITool] = []
+        self.tools: Tuple[CrewAITool, ...] = ()
+        self._tools_by_name: Mapping[str, CrewAITool] = {}
+        self._converted: Dict[str, BaseTool] = {}
+        self._all_tools: Optional[Tuple[BaseTool, ...]] = None
+        self._collect_metadata = bool(self.config.get("collect_metadata", True))
         self._register_tools()
 
+    def _metadata(
+        self,
+        start_time: float,
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[AdapterMetadata]:
+        """Build response metadata, or skip it when collection is off."""
+        if not self._collect_metadata:
+            return None
+        return create_metadata(
+            source=self._source_name,
+            start_time=start_time,
+            additional_data=additional_data
+        )
+
     def _validate_config(self) -> None:
         """Validate adapter configuration."""
         if not self.config.get("tools"):
@@ -111,7 +209,10 @@ class CrewAIToolsAdapter(BaseAdapter):
 
     def _register_tools(self) -> None:
         """Register native CrewAI tools from configuration."""
-        for tool_config in self.config.get("tools", []):
+        tools: List[CrewAITool] = []
+        by_name: Dict[str, CrewAITool] = {}
+        append = tools.append
+        for tool_config in self.config.get("tools", ()):
             try:
                 tool = CrewAITool(
                     name=tool_config["name"],
@@ -119,105 +220,164 @@ class CrewAIToolsAdapter(BaseAdapter):
                     parameters=tool_config.get("parameters", {}),
                     func=tool_config.get("func")
                 )
-                self.tools.append(tool)
-            except Exception as e:
-                logging.error(f"Failed to register tool {tool_config.get('name')}: {str(e)}")
+                # Schema compilation happens once here rather than on
+                # every conversion
+                tool.args_schema = _schema_for_tool(tool.name, tool.parameters)
+                if tool.func is None:
+                    tool.func = self._get_default_func(tool.name)
+                append(tool)
+                by_name[tool.name] = tool
+            except Exception:
+                logger.exception("Failed to register tool %s", tool_config.get("name"))
+        # Registration is final: freeze so caches can trust the contents
+        self.tools = tuple(tools)
+        self._tools_by_name = MappingProxyType(by_name)
 
     def _get_default_func(self, tool_name: str) -> Callable[..., str]:
         """Get default execution function for a tool."""
-        def default_func(**kwargs: Any) -> str:
-            formatted_params = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-            return f"{tool_name}({formatted_params})"
-        return default_func
+        return _DefaultToolCall(tool_name)
 
     def convert_to_crewai_tool(self, crewai_tool: CrewAITool) -> BaseTool:
-        """Convert adapter tool to CrewAI tool."""
-        execution_func = crewai_tool.func or self._get_default_func(crewai_tool.name)
+        """Convert adapter tool to CrewAI tool.
 
-        params = crewai_tool.parameters
-        if isinstance(params, str):
-            tool_schema = ToolInputSchema
-        else:
-            schema_name = f"{crewai_tool.name.title()}Schema"
-            tool_schema = _create_tool_schema(params, schema_name)
+        Conversions are cached per adapter instance since registered
+        tools are immutable; repeat calls skip the schema build.
+        """
+        cached = self._converted.get(crewai_tool.name)
+        if cached is not None:
+            return cached
 
-        return ConcreteCrewAITool(
+        execution_func = crewai_tool.func or self._get_default_func(crewai_tool.name)
+        tool_schema = crewai_tool.args_schema or _schema_for_tool(
+            crewai_tool.name, crewai_tool.parameters
+        )
+
+        converted = ConcreteCrewAITool(
             name=crewai_tool.name,
             description=crewai_tool.description,
             execution_func=execution_func,
             tool_args_schema=tool_schema
         )
+        self._converted[crewai_tool.name] = converted
+        return converted
+
+    def get_all_tools(self) -> Sequence[BaseTool]:
+        """Get all registered tools as CrewAI tools.
 
-    def get_all_tools(self) -> List[BaseTool]:
-        """Get all registered tools as CrewAI tools."""
-        return [self.convert_to_crewai_tool(tool) for tool in self.tools]
+        The result is an immutable tuple shared across callers; repeated
+        calls during agent planning return the same object.
+        """
+        if self._all_tools is None:
+            self._all_tools = tuple(
+                self.convert_to_crewai_tool(tool) for tool in self.tools
+            )
+        return self._all_tools
 
-    async def execute(self, **kwargs: Any) -> AdapterResponse:
+    async def execute(
+        self,
+        *,
+        tool_name: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        **_: Any
+    ) -> AdapterResponse:
         """Execute tool operation."""
-        start_time = time.time()
-        tool_name = kwargs.get("tool_name")
-        parameters = kwargs.get("parameters", {})
+        start_time = time.perf_counter()
+        parameters = parameters or {}
 
         if not tool_name:
             return AdapterResponse(
                 success=False,
                 error="Tool name is required",
-                metadata=create_metadata(source=self.__class__.__name__, start_time=start_time)
+                metadata=self._metadata(start_time)
             )
 
-        tool = next((t for t in self.tools if t.name == tool_name), None)
-        if not tool:
+        # EAFP: hits pay one subscript, misses take the exception path
+        try:
+            tool = self._tools_by_name[tool_name]
+        except KeyError:
             return AdapterResponse(
                 success=False,
-                error=f"Tool {tool_name} not found",
-                metadata=create_metadata(source=self.__class__.__name__, start_time=start_time)
+                error=self._MISSING_FMT(tool_name),
+                metadata=self._metadata(start_time)
             )
 
         try:
-            crewai_tool = self.convert_to_crewai_tool(tool)
-            if asyncio.get_event_loop().is_running():
-                result = await crewai_tool._arun(**parameters)
-            else:
-                result = crewai_tool._run(**parameters)
+            return await self._execute_ok(tool, tool_name, parameters, start_time)
+        except Exception as e:
+            return self._error_response(tool_name, e, start_time)
 
-            return AdapterResponse(
-                success=True,
-                data=str(result),
-                metadata=create_metadata(
-                    source=self.__class__.__name__,
-                    start_time=start_time,
-                    additional_data={"tool": tool_name, "parameters": parameters}
-                )
-            )
+    async def _execute_ok(
+        self,
+        tool: CrewAITool,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        start_time: float
+    ) -> AdapterResponse:
+        """Happy path of :meth:`execute`, kept free of error handling."""
+        crewai_tool = self.convert_to_crewai_tool(tool)
+        if asyncio.get_event_loop().is_running():
+            result = await crewai_tool._arun(**parameters)
+        else:
+            result = crewai_tool._run(**parameters)
 
-        except Exception as e:
-            return AdapterResponse(
-                success=False,
-                error=str(e),
-                metadata=create_metadata(
-                    source=self.__class__.__name__,
-                    start_time=start_time,
-                    additional_data={"tool": tool_name, "error": str(e)}
-                )
+        additional: Dict[str, Any] = {"tool": tool_name}
+        if parameters:
+            additional["parameters"] = parameters
+        return AdapterResponse(
+            success=True,
+            data=result if isinstance(result, str) else str(result),
+            metadata=self._metadata(start_time, additional_data=additional)
+        )
+
+    def _error_response(
+        self,
+        tool_name: str,
+        error: Exception,
+        start_time: float
+    ) -> AdapterResponse:
+        """Cold path: build the failure response for a tool call."""
+        error_text = str(error)
+        return AdapterResponse(
+            success=False,
+            error=error_text,
+            metadata=self._metadata(
+                start_time,
+                additional_data={"tool": tool_name, "error": error_text}
             )
+        )
+
+    async def execute_many(
+        self,
+        calls: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[AdapterResponse]:
+        """Execute a batch of independent tool calls concurrently.
+
+        For I/O-bound tools the batch completes in roughly the slowest
+        call's latency rather than the sum, bounded by the semaphore.
+
+        Args:
+            calls: Keyword-argument dicts for :meth:`execute`
+            concurrency: Maximum number of calls in flight at once
+
+        Returns:
+            Responses in the same order as the calls
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(call: Dict[str, Any]) -> AdapterResponse:
+            async with semaphore:
+                return await self.execute(**call)
+
+        return list(await asyncio.gather(*(_bounded(call) for call in calls)))
 
 class MCPToolsAdapter(CrewAIToolsAdapter):
-    """Adapter for handling MCP protocol tools."""
+    """Adapter for handling MCP protocol tools.
+
+    Registration is inherited: MCP tool configs carry the same shape as
+    native ones, with a session-backed ``func`` when one is provided.
+    """
 
     def __init__(self, config: Optional[AdapterConfig] = None) -> None:
         """Initialize adapter with config."""
-        super().__init__(config)
-
-    def _register_tools(self) -> None:
-        """Register MCP tools from configuration."""
-        for tool_config in self.config.get("tools", []):
-            try:
-                tool = CrewAITool(
-                    name=tool_config["name"],
-                    description=tool_config.get("description", ""),
-                    parameters=tool_config.get("parameters", {}),
-                    func=None  # MCP tools use default execution
-                )
-                self.tools.append(tool)
-            except Exception as e:
-                logging.error(f"Failed to register tool {tool_config.get('name')}: {str(e)}")
\ No newline at end of file
+        super().__init__(config)
\ No newline at end of file
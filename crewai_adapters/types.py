@@ -1,7 +1,10 @@
 """Type definitions for CrewAI adapters."""
-from typing import Any, Dict, Optional, TypedDict, Union
+from typing import Any, Dict, Optional, Union
 from dataclasses import dataclass
 
+# pydantic cannot validate typing.TypedDict on Python < 3.12
+from typing_extensions import TypedDict
+
 class AdapterConfig(Dict[str, Any]):
     """Configuration type for adapters."""
     pass
@@ -14,9 +17,13 @@ class AdapterMetadata(TypedDict):
     source: str
     additional_data: Optional[Dict[str, Any]]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdapterResponse:
-    """Response type for adapter execution."""
+    """Response type for adapter execution.
+
+    Frozen and slotted: responses are allocated per call, never mutated
+    after construction, and the slots keep them dict-free.
+    """
 
     success: bool
     data: Optional[Any] = None
@@ -19,7 +19,7 @@ def create_metadata(
     Returns:
         AdapterMetadata object
     """
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
 
     metadata: AdapterMetadata = {
         "timestamp": datetime.utcnow().isoformat(),
@@ -67,7 +67,7 @@ class MathServerAdapter(BaseAdapter):
 
     async def execute(self, **kwargs: Any) -> AdapterResponse:
         """Execute a math operation."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         tool_name = kwargs.get("tool_name")
         parameters = kwargs.get("parameters", {})
 
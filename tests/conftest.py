@@ -0,0 +1,67 @@
+"""Shared fixtures for the adapter test suite."""
+import asyncio
+import pytest
+
+from crewai_adapters.adapters.basic import BasicAdapter
+from crewai_adapters.tools import CrewAIToolsAdapter, MCPToolsAdapter
+from crewai_adapters.types import AdapterConfig
+from tests.fixtures import create_mock_crewai_tool, create_mock_mcp_tool
+
+@pytest.fixture(scope="session")
+def mock_mcp_tool():
+    """Mock MCP tool, built once for the whole session."""
+    return create_mock_mcp_tool()
+
+@pytest.fixture(scope="session")
+def mock_crewai_tool():
+    """Mock CrewAI tool, built once for the whole session."""
+    return asyncio.run(create_mock_crewai_tool())
+
+@pytest.fixture(scope="session")
+def basic_adapter():
+    """Configured BasicAdapter shared across tests."""
+    return BasicAdapter(AdapterConfig({"name": "TestAdapter"}))
+
+@pytest.fixture(scope="session")
+def crewai_adapter(mock_crewai_tool):
+    """CrewAIToolsAdapter configured with the mock tool."""
+    return CrewAIToolsAdapter(AdapterConfig({
+        "tools": [{
+            "name": mock_crewai_tool.name,
+            "description": mock_crewai_tool.description,
+            "parameters": mock_crewai_tool.parameters,
+            "func": mock_crewai_tool.func
+        }]
+    }))
+
+@pytest.fixture(scope="session")
+def basic_default_response(basic_adapter):
+    """Response from one shared no-argument execute of BasicAdapter."""
+    return asyncio.run(basic_adapter.execute())
+
+@pytest.fixture(scope="session")
+def crewai_response(crewai_adapter, mock_crewai_tool):
+    """Response from one shared execute of the CrewAI adapter's mock tool."""
+    return asyncio.run(crewai_adapter.execute(
+        tool_name=mock_crewai_tool.name,
+        parameters={"test": "value"}
+    ))
+
+@pytest.fixture(scope="session")
+def mcp_response(mcp_adapter, mock_mcp_tool):
+    """Response from one shared execute of the MCP adapter's mock tool."""
+    return asyncio.run(mcp_adapter.execute(
+        tool_name=mock_mcp_tool.name,
+        parameters={"test": "value"}
+    ))
+
+@pytest.fixture(scope="session")
+def mcp_adapter(mock_mcp_tool):
+    """MCPToolsAdapter configured with the mock tool."""
+    return MCPToolsAdapter(AdapterConfig({
+        "tools": [{
+            "name": mock_mcp_tool.name,
+            "description": mock_mcp_tool.description,
+            "parameters": mock_mcp_tool.inputSchema
+        }]
+    }))
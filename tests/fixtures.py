@@ -1,9 +1,10 @@
 """Test fixtures and helper classes for testing."""
-from typing import Any, Dict, List
+import functools
+from typing import Any, Optional
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from crewai_adapters.base import BaseAdapter
-from crewai_adapters.types import AdapterResponse, AdapterConfig
+from crewai_adapters.types import AdapterMetadata, AdapterResponse
 from crewai_adapters.tools import CrewAITool
 from mcp.types import Tool as MCPTool
 
@@ -21,6 +22,9 @@ class MockTool(BaseTool):
         """Execute the mock tool."""
         return f"mock_result: {test}"
 
+#: Computed once; pydantic rebuilds the JSON schema on every call otherwise.
+_MOCK_INPUT_SCHEMA = MockToolInput.model_json_schema()
+
 class MockAdapter(BaseAdapter):
     """Mock adapter implementation for testing."""
 
@@ -32,22 +36,40 @@ class MockAdapter(BaseAdapter):
         """Execute test functionality."""
         return AdapterResponse(success=True, data="test")
 
+#: Precompiled validator for the metadata TypedDict; one C-level check
+#: replaces the per-field isinstance assertions.
+_METADATA_VALIDATOR = TypeAdapter(AdapterMetadata)
+
+def assert_metadata(md: Any, source: str) -> None:
+    """Assert a response metadata mapping has the expected shape and source."""
+    assert md is not None
+    _METADATA_VALIDATOR.validate_python(md, strict=True)
+    assert md["source"] == source
+
+#: Memoized result of :func:`create_mock_crewai_tool`; the factory is
+#: pure, so one instance serves the whole suite.
+_mock_crewai_tool: Optional[CrewAITool] = None
+
 async def create_mock_crewai_tool() -> CrewAITool:
     """Create a mock CrewAI tool."""
-    async def mock_execute(test: str) -> str:
-        return f"mock_result: {test}"
+    global _mock_crewai_tool
+    if _mock_crewai_tool is None:
+        async def mock_execute(test: str) -> str:
+            return f"mock_result: {test}"
 
-    return CrewAITool(
-        name="mock_crewai_tool",
-        description="Mock CrewAI tool for testing",
-        parameters=MockToolInput.model_json_schema(),
-        func=mock_execute
-    )
+        _mock_crewai_tool = CrewAITool(
+            name="mock_crewai_tool",
+            description="Mock CrewAI tool for testing",
+            parameters=_MOCK_INPUT_SCHEMA,
+            func=mock_execute
+        )
+    return _mock_crewai_tool
 
+@functools.lru_cache(maxsize=None)
 def create_mock_mcp_tool() -> MCPTool:
     """Create a mock MCP tool."""
     return MCPTool(
         name="mock_mcp_tool",
         description="Mock MCP tool for testing",
-        inputSchema=MockToolInput.model_json_schema()
+        inputSchema=_MOCK_INPUT_SCHEMA
     )
\ No newline at end of file
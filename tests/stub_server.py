@@ -0,0 +1,12 @@
+"""Minimal stdio MCP server used by the integration tests."""
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("Stub")
+
+@mcp.tool()
+def echo(test: str) -> str:
+    """Echo the given value."""
+    return f"echo: {test}"
+
+if __name__ == "__main__":
+    mcp.run()
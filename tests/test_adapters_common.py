@@ -0,0 +1,101 @@
+"""Shared adapter behaviors, parametrized across the implementations."""
+import sys
+
+import pytest
+from crewai_adapters.adapters.basic import BasicAdapter
+from crewai_adapters.tools import CrewAIToolsAdapter, MCPToolsAdapter
+from crewai_adapters.exceptions import ConfigurationError
+from crewai_adapters.types import AdapterConfig
+from tests.fixtures import assert_metadata
+
+#: Shared configs; adapters only read their config, so one instance is safe.
+_EMPTY_CFG = AdapterConfig({})
+_SINGLE_TOOL_CFG = AdapterConfig({
+    "tools": [{
+        "name": "test_tool",
+        "description": "Test tool",
+        "parameters": {}
+    }]
+})
+
+#: Interned so the equality check can take the pointer-comparison fast path.
+_MISSING_ERR = sys.intern("Tool non_existent not found")
+
+@pytest.mark.parametrize(
+    "adapter_cls",
+    [BasicAdapter, CrewAIToolsAdapter, MCPToolsAdapter],
+    ids=["basic", "crewai", "mcp"]
+)
+async def test_missing_config(adapter_cls):
+    """Every adapter rejects an empty configuration."""
+    with pytest.raises(ConfigurationError):
+        adapter = adapter_cls(_EMPTY_CFG)
+        await adapter.execute()
+
+@pytest.mark.parametrize(
+    "adapter_cls",
+    [CrewAIToolsAdapter, MCPToolsAdapter],
+    ids=["crewai", "mcp"]
+)
+async def test_missing_tool(adapter_cls):
+    """Tool adapters report unknown tool names as failures."""
+    adapter = adapter_cls(_SINGLE_TOOL_CFG)
+
+    response = await adapter.execute(tool_name="non_existent")
+    assert not response.success
+    assert response.error == _MISSING_ERR
+
+async def test_execute_many(crewai_adapter, mock_crewai_tool):
+    """Batched calls run concurrently and keep their order."""
+    calls = [
+        {"tool_name": mock_crewai_tool.name, "parameters": {"test": f"v{i}"}}
+        for i in range(3)
+    ]
+    responses = await crewai_adapter.execute_many(calls)
+    assert all(response.success for response in responses)
+    assert [response.data for response in responses] == [
+        "mock_result: v0", "mock_result: v1", "mock_result: v2"
+    ]
+
+async def test_collect_metadata_disabled(mock_crewai_tool):
+    """Metadata collection can be switched off per adapter."""
+    adapter = CrewAIToolsAdapter(AdapterConfig({
+        "tools": [{
+            "name": mock_crewai_tool.name,
+            "description": mock_crewai_tool.description,
+            "parameters": mock_crewai_tool.parameters,
+            "func": mock_crewai_tool.func
+        }],
+        "collect_metadata": False
+    }))
+
+    response = await adapter.execute(
+        tool_name=mock_crewai_tool.name,
+        parameters={"test": "value"}
+    )
+    assert response.success
+    assert response.metadata is None
+
+@pytest.fixture
+def response_and_source(request):
+    """Resolve the shared (response, source) pair named by the param.
+
+    Indirection keeps fixture resolution in the sync setup phase, where
+    the session-scoped fixtures can be materialized safely.
+    """
+    response_fixture, source = request.param
+    return request.getfixturevalue(response_fixture), source
+
+@pytest.mark.parametrize(
+    "response_and_source",
+    [
+        ("crewai_response", "CrewAIToolsAdapter"),
+        ("mcp_response", "MCPToolsAdapter"),
+    ],
+    indirect=True,
+    ids=["crewai", "mcp"]
+)
+def test_metadata_structure(response_and_source):
+    """Tool adapters attach complete metadata to responses."""
+    response, source = response_and_source
+    assert_metadata(response.metadata, source)
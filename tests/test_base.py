@@ -1,50 +1,19 @@
 """Tests for base adapter functionality."""
-import pytest
 from tests.fixtures import MockAdapter
-from crewai.tools import BaseTool
-from crewai_adapters.base import BaseAdapter, AdapterRegistry
-from crewai_adapters.types import AdapterConfig, AdapterResponse
-from crewai_adapters.exceptions import AdapterError, ConfigurationError
+from crewai_adapters.types import AdapterConfig
 
-def test_adapter_registry():
-    """Test adapter registry functionality."""
-    # Clear registry
-    AdapterRegistry._adapters = {}
+_TEST_CFG = AdapterConfig({"test": "value"})
 
-    # Test registration
-    AdapterRegistry.register("test", MockAdapter)
-    assert "test" in AdapterRegistry._adapters
-
-    # Test retrieval
-    adapter_cls = AdapterRegistry.get("test")
-    assert adapter_cls == MockAdapter
-
-    # Test duplicate registration
-    with pytest.raises(AdapterError):
-        AdapterRegistry.register("test", MockAdapter)
-
-    # Test getting non-existent adapter
-    with pytest.raises(AdapterError):
-        AdapterRegistry.get("non_existent")
-
-    # Test listing adapters
-    adapters = AdapterRegistry.list_adapters()
-    assert "test" in adapters
-    assert len(adapters) == 1
-
-@pytest.mark.asyncio
 async def test_base_adapter():
     """Test base adapter functionality."""
-    config = AdapterConfig({"test": "value"})
-    adapter = MockAdapter(config)
+    adapter = MockAdapter(_TEST_CFG)
 
-    assert adapter.config == config
+    assert adapter.config == _TEST_CFG
 
     response = await adapter.execute()
     assert response.success
     assert response.data == "test"
 
-@pytest.mark.asyncio
 async def test_adapter_creation():
     """Test adapter creation with kwargs."""
     adapter = MockAdapter.create(test="value")
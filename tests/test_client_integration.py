@@ -0,0 +1,68 @@
+"""Integration tests for the MCP client stack.
+
+These spawn the stdio stub server in tests/stub_server.py, exercising
+the real pool, client and loop-thread paths end to end.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from crewai_adapters.client import CrewAIAdapterClient
+from crewai_adapters.exceptions import ExecutionError
+from crewai_adapters.loop import MCPClientWrapper
+
+_STUB = {
+    "command": sys.executable,
+    "args": [str(Path(__file__).with_name("stub_server.py"))]
+}
+
+async def test_connect_and_call_tool():
+    """Connect to the stub server, convert its tool, and call it."""
+    async with CrewAIAdapterClient() as client:
+        await client.connect_to_mcp_server("stub", **_STUB)
+        tools = client.get_tools("stub")
+        assert [tool.name for tool in tools] == ["echo"]
+        assert await tools[0]._arun(test="value") == "echo: value"
+
+async def test_connect_to_servers_clean_exit():
+    """Concurrent connects share the pooled session and exit cleanly."""
+    async with CrewAIAdapterClient() as client:
+        await client.connect_to_servers({"stub": _STUB, "stub2": _STUB})
+        assert len(client.get_tools()) == 2
+        assert await client.get_tools("stub2")[0]._arun(test="x") == "echo: x"
+
+async def test_reconnect_after_close():
+    """A fresh connect after a full close must not reuse dead sessions."""
+    async with CrewAIAdapterClient() as client:
+        await client.connect_to_mcp_server("stub", **_STUB)
+    async with CrewAIAdapterClient() as client:
+        await client.connect_to_mcp_server("stub", **_STUB)
+        assert await client.get_tools("stub")[0]._arun(test="again") == "echo: again"
+
+def test_sync_wrapper_connect_call_close():
+    """The sync facade connects, runs a tool and closes without a loop."""
+    wrapper = MCPClientWrapper()
+    wrapper.connect_to_mcp_server("stub", **_STUB)
+    tools = wrapper.get_tools("stub")
+    assert tools[0]._run(test="sync") == "echo: sync"
+    wrapper.close()
+
+def test_convert_call_result():
+    """Text chunks are joined and tool errors raised."""
+    ok = CallToolResult(
+        content=[
+            TextContent(type="text", text="a"),
+            TextContent(type="text", text="b")
+        ],
+        isError=False
+    )
+    assert CrewAIAdapterClient._convert_call_result(ok) == "a\n\nb"
+
+    failed = CallToolResult(
+        content=[TextContent(type="text", text="boom")],
+        isError=True
+    )
+    with pytest.raises(ExecutionError):
+        CrewAIAdapterClient._convert_call_result(failed)
@@ -0,0 +1,46 @@
+"""Tests for the adapter registry.
+
+Kept apart from the other base tests because these mutate the
+class-level registry; the xdist group pins them to one worker.
+"""
+import pytest
+from tests.fixtures import MockAdapter
+from crewai_adapters.base import AdapterRegistry
+from crewai_adapters.exceptions import AdapterError
+
+pytestmark = pytest.mark.xdist_group("registry")
+
+@pytest.fixture(scope="module")
+def registered_mock():
+    """Empty the registry, register MockAdapter once, restore afterwards.
+
+    Mutates the existing dict in place rather than rebinding it, so
+    other references to the registry stay valid.
+    """
+    saved = AdapterRegistry._adapters.copy()
+    AdapterRegistry._adapters.clear()
+    AdapterRegistry.register("test", MockAdapter)
+    yield
+    AdapterRegistry._adapters.clear()
+    AdapterRegistry._adapters.update(saved)
+
+def test_registration(registered_mock):
+    """Test registration and retrieval."""
+    assert "test" in AdapterRegistry._adapters
+    assert AdapterRegistry.get("test") == MockAdapter
+
+def test_duplicate_registration(registered_mock):
+    """Test that re-registering a name fails."""
+    with pytest.raises(AdapterError):
+        AdapterRegistry.register("test", MockAdapter)
+
+def test_get_missing(registered_mock):
+    """Test getting a non-existent adapter."""
+    with pytest.raises(AdapterError):
+        AdapterRegistry.get("non_existent")
+
+def test_list_adapters(registered_mock):
+    """Test listing registered adapters."""
+    adapters = AdapterRegistry.list_adapters()
+    assert "test" in adapters
+    assert len(adapters) == 1